@@ -3,7 +3,7 @@ import numpy as np
 from scipy.sparse import csr_matrix
 
 
-def User_based_CF(training_data, noise):
+def User_based_CF(training_data, noise, item_ids=None):
     """
     Recommend items to all users based on a user-based collaborative filtering algorithm.
 
@@ -11,12 +11,18 @@ def User_based_CF(training_data, noise):
     interaction_matrix (numpy array): Matrix of user-item interactions.
     params (Param): An instance of the Param class.
     noise (numpy array): An array of random noise used to break ties.
+    item_ids (numpy array, optional): IDs of the items in the algorithm's corpus slice. If given, only these items are scored and ranked.
 
     Returns:
     ranked_items_all_users (numpy array): 2D array of ranked item IDs recommended to each user.
     consumed_items_all_users (boolean matrix): An matrix indicating whether each user has consumed each item in the recommendation list.
     """
-    
+
+    # Only score and rank the items in the given corpus slice
+    if item_ids is not None:
+        training_data = training_data[:, item_ids]
+        noise = noise[:, item_ids]
+
     noise_copy = noise.copy()
     # Convert training_data to a sparse matrix
     training_data_sparse = csr_matrix(training_data)
@@ -46,21 +52,31 @@ def User_based_CF(training_data, noise):
     rows = np.arange(already_interacted.shape[0])[:, None]
     consumed_items_all_users = already_interacted[rows, ranked_items_all_users]
     
+    # Map positions in the corpus slice back to item IDs
+    if item_ids is not None:
+        ranked_items_all_users = item_ids[ranked_items_all_users]
+
     return ranked_items_all_users
 
 
-def Item_based_CF(training_data, noise):
+def Item_based_CF(training_data, noise, item_ids=None):
     """
     Recommend items to all users based on an item-based collaborative filtering algorithm using cosine similarity.
 
     Parameters:
     training_data (numpy array): Matrix of user-item interactions.
     noise (numpy array): An array of random noise used to break ties.
+    item_ids (numpy array, optional): IDs of the items in the algorithm's corpus slice. If given, only these items are scored and ranked.
 
     Returns:
     ranked_items_all_users (numpy array): 2D array of ranked item IDs recommended to each user.
     consumed_items_all_users (boolean matrix): An matrix indicating whether each user has consumed each item in the recommendation list.
     """
+    # Only score and rank the items in the given corpus slice
+    if item_ids is not None:
+        training_data = training_data[:, item_ids]
+        noise = noise[:, item_ids]
+
     noise_copy = noise.copy()
     
     # Calculate the item similarity matrix using cosine similarity
@@ -82,21 +98,31 @@ def Item_based_CF(training_data, noise):
     consumed_items_all_users = already_interacted[rows, ranked_items_all_users]
 
     
+    # Map positions in the corpus slice back to item IDs
+    if item_ids is not None:
+        ranked_items_all_users = item_ids[ranked_items_all_users]
+
     return ranked_items_all_users
 
 
-def Random_alg(training_data, noise):
+def Random_alg(training_data, noise, item_ids=None):
     """
     Recommend items to all users based on a random recommendation strategy.
 
     Parameters:
     interaction_matrix (numpy array): Matrix of user-item interactions.
     noise (numpy array): An array of random noise used to break ties.
+    item_ids (numpy array, optional): IDs of the items in the algorithm's corpus slice. If given, only these items are scored and ranked.
 
     Returns:
     ranked_items_all_users (numpy array): 2D array of ranked item IDs recommended to each user.
     consumed_items_all_users (boolean matrix): An matrix indicating whether each user has consumed each item in the recommendation list.
     """
+    # Only score and rank the items in the given corpus slice
+    if item_ids is not None:
+        training_data = training_data[:, item_ids]
+        noise = noise[:, item_ids]
+
     noise_copy = noise.copy()
 
     # Sort items by noise for each user
@@ -109,9 +135,13 @@ def Random_alg(training_data, noise):
     rows = np.arange(already_interacted.shape[0])[:, None]
     consumed_items_all_users = already_interacted[rows, ranked_items_all_users]
 
+    # Map positions in the corpus slice back to item IDs
+    if item_ids is not None:
+        ranked_items_all_users = item_ids[ranked_items_all_users]
+
     return ranked_items_all_users
 
-def Ideal_alg(training_data, user_item_utility, noise):
+def Ideal_alg(training_data, user_item_utility, noise, item_ids=None):
     """
     Recommend items to all users based on the highest utility among unconsumed items, and then consumed items.
 
@@ -119,11 +149,17 @@ def Ideal_alg(training_data, user_item_utility, noise):
     interaction_matrix (numpy array): Matrix of user-item interactions.
     user_item_utility (numpy array): Matrix of user-item utility values.
     noise (numpy array): An array of random noise used to break ties.
+    item_ids (numpy array, optional): IDs of the items in the algorithm's corpus slice. If given, only these items are scored and ranked.
 
     Returns:
     ranked_items_all_users (numpy array): 2D array of ranked item IDs recommended to each user.
     consumed_items_all_users (boolean matrix): An matrix indicating whether each user has consumed each item in the recommendation list.
     """
+    # Only score and rank the items in the given corpus slice
+    if item_ids is not None:
+        training_data = training_data[:, item_ids]
+        noise = noise[:, item_ids]
+
     noise_copy = noise.copy()
     # Initialize ranked items with infinities
     ranked_items_all_users = np.full_like(training_data, np.inf)
@@ -132,7 +168,10 @@ def Ideal_alg(training_data, user_item_utility, noise):
     unconsumed_items = training_data == 0
 
     # Rank the unconsumed items by utility for each user
-    utility = user_item_utility[:,:np.shape(unconsumed_items)[1]].copy()
+    if item_ids is None:
+        utility = user_item_utility[:,:np.shape(unconsumed_items)[1]].copy()
+    else:
+        utility = user_item_utility[:, item_ids]
     utility[~unconsumed_items] = -np.inf
     ranked_unconsumed_items = np.argsort(utility, axis=1)[:, ::-1]
 
@@ -156,4 +195,8 @@ def Ideal_alg(training_data, user_item_utility, noise):
     rows = np.arange(consumed_items.shape[0])[:, None]
     consumed_items_all_users = consumed_items[rows, ranked_items_all_users]
     
+    # Map positions in the corpus slice back to item IDs
+    if item_ids is not None:
+        ranked_items_all_users = item_ids[ranked_items_all_users]
+
     return ranked_items_all_users
\ No newline at end of file